@@ -1,11 +1,16 @@
 import warnings
 
+__version__ = "1.0.4"
+
 from .body import * 
 from .craft import *
 from .maneuver import *
+from .mission import *
 from .orbit_plotter import *
 from .orbit import *
 from .plotting_calculator import *
+from .render_worker import *
+from .scenario import *
 
 # Ignore RuntimeWarning that may result when plotting parabolic orbit (since there is theoretically no end to plot)
 warnings.filterwarnings("ignore", category = RuntimeWarning)
\ No newline at end of file
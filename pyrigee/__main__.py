@@ -0,0 +1,100 @@
+'''
+File containing the command line entry point, used with python -m pyrigee
+'''
+import argparse
+import sys
+import time
+from pyrigee.render_worker import RenderPool, benchmark, parse_address, serve_socket, serve_stdin
+from pyrigee.scenario import *
+
+'''
+Starts a pool of warm render workers and serves requests from the given address ("-" for stdin) until stdin is
+closed or the program is interrupted. Reports how long each worker's cold render took on stderr
+'''
+def serve(address, jobs):
+    pool = RenderPool(jobs)
+
+    for pid, cold_time in sorted(pool.cold_times.items()):
+        print(f"worker {pid}: cold render in {cold_time:.3f}s", file = sys.stderr)
+
+    try:
+        if address == "-":
+            serve_stdin(pool)
+        else:
+            print(f"serving on {address}", file = sys.stderr)
+            serve_socket(pool, address)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown()
+
+'''
+Renders the scenario files given on the command line and prints how long each scenario took, or serves render
+requests with a pool of warm workers. Returns the exit code of the program
+'''
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "python -m pyrigee", description = "Render pyrigee scenario files to images.")
+    parser.add_argument("paths", nargs = "*", help = "scenario files (.json or .toml) or directories of scenario files")
+    parser.add_argument("-o", "--output-dir", default = "pyrigee_output", help = "directory to save images to (default: %(default)s)")
+    parser.add_argument("-j", "--jobs", type = int, default = None, help = "number of scenarios to render at once (default: one per CPU)")
+    parser.add_argument("-f", "--format", dest = "image_format", default = "png", help = "image format to save (default: %(default)s)")
+    parser.add_argument("--force", action = "store_true", help = "render every scenario, even if it hasn't changed")
+    parser.add_argument("--serve", metavar = "ADDRESS", help = "serve render requests with warm workers on host:port, a Unix socket path, or - for stdin")
+    parser.add_argument("--benchmark", action = "store_true", help = "compare the latency of cold and warm renders")
+    args = parser.parse_args(argv)
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.serve is not None:
+        if args.serve != "-":
+            try:
+                parse_address(args.serve)
+            except ValueError as e:
+                parser.error(str(e))
+
+        try:
+            serve(args.serve, args.jobs)
+        except OSError as e:
+            print(f"error: {e}", file = sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            # Interrupted while the workers were starting
+            return 130
+
+        return 0
+
+    if args.benchmark:
+        cold_latency, warm_latency = benchmark()
+        print(f"cold render: {cold_latency:.3f}s")
+        print(f"warm render: {warm_latency:.3f}s")
+        return 0
+
+    if not args.paths:
+        parser.error("at least one scenario file or directory is required")
+
+    start = time.perf_counter()
+    failures = 0
+
+    try:
+        scenarios = []
+
+        for path in args.paths:
+            scenarios += load_scenarios(path)
+
+        for scenario, status, elapsed, result in run_scenarios(scenarios, args.output_dir, args.jobs, args.image_format, args.force):
+            if status == "failed":
+                failures += 1
+                print(f"{scenario.name}: failed ({result})")
+            else:
+                print(f"{scenario.name}: {status} in {elapsed:.3f}s, delta-v {sum(result):.3f} km/s")
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file = sys.stderr)
+        return 1
+
+    print(f"{len(scenarios)} scenarios in {time.perf_counter() - start:.3f}s, {failures} failed")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+'''
+File containing the numeric kernels that PlottingCalculator uses to calculate plotting coordinates. The NumPy
+versions are used by default. If Numba is installed and turned on, the kernels are compiled into fused loops that
+only allocate their outputs instead
+'''
+import math
+import os
+import numpy as np
+
+'''
+Whether the kernels are compiled with Numba. Set the PYRIGEE_USE_NUMBA environment variable to turn Numba on. It
+is off by default since orbits only have a few hundred points, which NumPy handles faster than importing and
+compiling with Numba takes
+'''
+NUMBA_ENABLED = False
+
+# Numba is optional, and only imported if it was turned on
+if os.environ.get("PYRIGEE_USE_NUMBA"):
+    try:
+        import numba
+
+        NUMBA_ENABLED = True
+    except ImportError:
+        pass
+
+'''
+Calculates the x, y, z coordinates of a sphere with NumPy. Takes 2D arrays of theta and phi values and the radius
+of the sphere
+'''
+def numpy_body_coords(theta, phi, radius):
+    x = radius * np.cos(theta) * np.sin(phi)
+    y = radius * np.sin(theta) * np.sin(phi)
+    z = radius * np.cos(phi)
+
+    return (x, y, z)
+
+'''
+Calculates the x, y, z coordinates of an elliptical orbit with NumPy. Takes an array of theta values, the orbit's
+inclination (in radians), eccentricity, and semi-major axis, whether the orbit should be flipped, and the tick
+value to scale the coordinates by
+'''
+def numpy_elliptical_orbit_coords(theta, inclination, eccentricity, semi_major_axis, negative, tick_value):
+    # Polar equation of ellipse
+    r = (semi_major_axis * (1 - eccentricity**2)) / (1 - eccentricity * np.cos(theta))
+
+    # Flip orbit if negative flag is true
+    if negative:
+        r *= -1
+
+    # Convert polar equations to cartesean coords based on the given orbital inclination
+    x = r * np.cos(theta) * np.cos(inclination)
+    y = r * np.sin(theta)
+    z = x * np.tan(inclination)
+
+    return (x / tick_value, y / tick_value, z / tick_value)
+
+'''
+Calculates the x, y, z coordinates of a parabolic orbit with NumPy. Takes an array of theta values, the orbit's
+perigee, the radius of the body being orbited, the orbit's inclination (in radians), and the tick value to scale
+the coordinates by
+'''
+def numpy_parabolic_orbit_coords(theta, perigee, body_radius, inclination, tick_value):
+    # Polar equation of parabola
+    r = (perigee * 2 + (body_radius * 2)) / (1 - np.cos(theta))
+
+    # Convert polar equations to cartesean coords based on the given orbital inclination
+    x = r * np.cos(theta) * np.cos(inclination)
+    y = r * np.sin(theta)
+    z = r * np.sin(inclination) * np.cos(theta)
+
+    return (x / tick_value, y / tick_value, z / tick_value)
+
+if NUMBA_ENABLED:
+    '''
+    Numba versions of the kernels above, taking the same arguments and doing the same arithmetic in the same order
+    one element at a time. error_model = "numpy" makes division by zero give inf like NumPy does (parabolic orbits
+    have no end) instead of raising. The loops are too short to be worth running in parallel, and threads would
+    compete with the processes of RenderPool and run_scenarios for cores
+    '''
+    __jit = numba.njit(cache = True, error_model = "numpy")
+
+    @__jit
+    def numba_body_coords(theta, phi, radius):
+        x = np.empty(theta.shape)
+        y = np.empty(theta.shape)
+        z = np.empty(theta.shape)
+
+        for i in range(theta.shape[0]):
+            for j in range(theta.shape[1]):
+                x[i, j] = radius * math.cos(theta[i, j]) * math.sin(phi[i, j])
+                y[i, j] = radius * math.sin(theta[i, j]) * math.sin(phi[i, j])
+                z[i, j] = radius * math.cos(phi[i, j])
+
+        return (x, y, z)
+
+    @__jit
+    def numba_elliptical_orbit_coords(theta, inclination, eccentricity, semi_major_axis, negative, tick_value):
+        x = np.empty(theta.size)
+        y = np.empty(theta.size)
+        z = np.empty(theta.size)
+
+        semi_latus_rectum = semi_major_axis * (1 - eccentricity**2)
+        cos_inclination = math.cos(inclination)
+        tan_inclination = math.tan(inclination)
+
+        for i in range(theta.size):
+            r = semi_latus_rectum / (1 - eccentricity * math.cos(theta[i]))
+
+            if negative:
+                r *= -1
+
+            orbit_x = r * math.cos(theta[i]) * cos_inclination
+            x[i] = orbit_x / tick_value
+            y[i] = (r * math.sin(theta[i])) / tick_value
+            z[i] = (orbit_x * tan_inclination) / tick_value
+
+        return (x, y, z)
+
+    @__jit
+    def numba_parabolic_orbit_coords(theta, perigee, body_radius, inclination, tick_value):
+        x = np.empty(theta.size)
+        y = np.empty(theta.size)
+        z = np.empty(theta.size)
+
+        semi_latus_rectum = perigee * 2 + (body_radius * 2)
+        cos_inclination = math.cos(inclination)
+        sin_inclination = math.sin(inclination)
+
+        for i in range(theta.size):
+            r = semi_latus_rectum / (1 - math.cos(theta[i]))
+
+            x[i] = (r * math.cos(theta[i]) * cos_inclination) / tick_value
+            y[i] = (r * math.sin(theta[i])) / tick_value
+            z[i] = (r * sin_inclination * math.cos(theta[i])) / tick_value
+
+        return (x, y, z)
+
+    body_coords = numba_body_coords
+    elliptical_orbit_coords = numba_elliptical_orbit_coords
+    parabolic_orbit_coords = numba_parabolic_orbit_coords
+else:
+    body_coords = numpy_body_coords
+    elliptical_orbit_coords = numpy_elliptical_orbit_coords
+    parabolic_orbit_coords = numpy_parabolic_orbit_coords
@@ -14,4 +14,48 @@ class Maneuver:
     '''
     def __init__(self, to, c):
         self.target_orbit = to
-        self.color = c
\ No newline at end of file
+        self.color = c
+
+    '''
+    Calculates the total delta-v (in km/s) needed to perform this maneuver. Takes the orbit the maneuver starts from
+    and the body being orbited. Follows the same plan as the plotted maneuver: a Hohmann transfer from the initial
+    perigee to the target apogee, with any inclination change done at the highest orbit where the burn is cheaper
+    '''
+    def calculate_delta_v(self, initial_orbit, body):
+        target_orbit = self.target_orbit
+        delta_v = 0
+
+        # If there is a change in the orbit radius, add the two burns of the Hohmann transfer
+        if initial_orbit.apogee != target_orbit.apogee:
+            transfer_semi_major_axis = ((initial_orbit.perigee + target_orbit.apogee) / 2) + body.radius
+
+            # Burn at the transfer perigee to enter the transfer orbit
+            initial_velocity = body.get_orbital_velocity(initial_orbit.perigee, self.__calculate_semi_major_axis(initial_orbit, body))
+            departure_velocity = body.get_orbital_velocity(initial_orbit.perigee, transfer_semi_major_axis)
+            delta_v += abs(departure_velocity - initial_velocity)
+
+            # Burn at the transfer apogee to enter the target orbit
+            arrival_velocity = body.get_orbital_velocity(target_orbit.apogee, transfer_semi_major_axis)
+            target_velocity = body.get_orbital_velocity(target_orbit.apogee, self.__calculate_semi_major_axis(target_orbit, body))
+            delta_v += abs(target_velocity - arrival_velocity)
+
+        # If there is an inclination difference, add a plane change burn at the highest orbit
+        if initial_orbit.inclination != target_orbit.inclination:
+            highest_orbit = target_orbit
+
+            if initial_orbit.apogee > target_orbit.apogee:
+                highest_orbit = initial_orbit
+
+            # Velocity at the apogee of the highest orbit, where the plane change is done
+            plane_change_velocity = body.get_orbital_velocity(highest_orbit.apogee, self.__calculate_semi_major_axis(highest_orbit, body))
+
+            inclination_change = math.radians(abs(target_orbit.inclination - initial_orbit.inclination))
+            delta_v += 2 * plane_change_velocity * math.sin(inclination_change / 2)
+
+        return delta_v
+
+    '''
+    Private helper function that returns the semi-major axis of the given orbit around the given body
+    '''
+    def __calculate_semi_major_axis(self, orbit, body):
+        return ((orbit.apogee + orbit.perigee) / 2) + body.radius
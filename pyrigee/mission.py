@@ -0,0 +1,162 @@
+'''
+File containing definition of Mission class
+'''
+from pyrigee.maneuver import *
+from pyrigee.orbit import *
+
+'''
+Class that holds what was last computed and plotted for one leg of a mission
+'''
+class _Leg:
+    '''
+    Init function takes the leg's inputs as a tuple (used to tell when the leg needs to be recomputed), the
+    leg's delta-v (in km/s), and the matplotlib artists plotted for the leg
+    '''
+    def __init__(self, k, dv, a):
+        self.key = k
+        self.delta_v = dv
+        self.artists = a
+
+'''
+Class used for defining a mission made of a chain of maneuvers flown by one craft, such as parking orbit, transfer,
+plane change, phasing, and station. Each maneuver starts from the orbit the previous one ended in. The delta-v and
+plotted artists of each leg are cached, and only legs whose orbits or maneuver changed are recomputed and redrawn,
+so editing one leg of a long mission stays fast
+'''
+class Mission:
+    '''
+    Init function takes the OrbitPlotter to plot the mission on, the Craft flying the mission, and the orbit the
+    mission starts in
+    '''
+    def __init__(self, p, c, o):
+        self.plotter = p
+        self.craft = c
+        self.initial_orbit = o
+
+        # The maneuvers of the mission, and what was last computed for each of them (None until computed)
+        self.__maneuvers = []
+        self.__legs = []
+
+        # What was last plotted for the initial orbit
+        self.__initial_leg = None
+
+    '''
+    Adds a maneuver to the end of the mission
+    '''
+    def add_maneuver(self, maneuver):
+        self.insert_maneuver(len(self.__maneuvers), maneuver)
+
+    '''
+    Inserts a maneuver before the leg at the given index
+    '''
+    def insert_maneuver(self, index, maneuver):
+        self.__maneuvers.insert(index, maneuver)
+        self.__legs.insert(index, None)
+
+    '''
+    Replaces the maneuver of the leg at the given index
+    '''
+    def set_maneuver(self, index, maneuver):
+        self.__maneuvers[index] = maneuver
+
+    '''
+    Removes the leg at the given index from the mission and from the plot
+    '''
+    def remove_maneuver(self, index):
+        self.__maneuvers.pop(index)
+        leg = self.__legs.pop(index)
+
+        if leg is not None:
+            self.__remove_artists(leg)
+
+    '''
+    Returns a list of the maneuvers of the mission, in order
+    '''
+    def get_maneuvers(self):
+        return list(self.__maneuvers)
+
+    '''
+    Returns the orbit the craft is in after the leg at the given index
+    '''
+    def get_orbit(self, index):
+        return self.__maneuvers[index].target_orbit
+
+    '''
+    Returns the delta-v (in km/s) of the leg at the given index
+    '''
+    def get_delta_v(self, index):
+        self.update()
+
+        return self.__legs[index].delta_v
+
+    '''
+    Returns the total delta-v (in km/s) of the mission
+    '''
+    def get_total_delta_v(self):
+        self.update()
+
+        return sum(leg.delta_v for leg in self.__legs)
+
+    '''
+    Recomputes and replots every leg whose inputs changed since it was last plotted: the orbit it starts from,
+    its maneuver, the craft, or the body. Since each leg starts from the orbit the previous leg ended in, editing
+    one leg also updates the leg after it, while the rest are left alone. Orbits edited in place are noticed too.
+    Returns a list of the indices of the legs that were updated
+    '''
+    def update(self):
+        body = self.plotter.body
+        body_key = (body.name, body.mass, body.radius, body.color)
+        craft_key = (self.craft.name, self.craft.color)
+
+        updated = []
+
+        # Plot the initial orbit if it changed
+        key = (body_key, craft_key, self.__describe_orbit(self.initial_orbit))
+        replot_initial_orbit = self.__initial_leg is None or self.__initial_leg.key != key
+
+        if replot_initial_orbit:
+            if self.__initial_leg is not None:
+                self.__remove_artists(self.__initial_leg)
+
+            self.__initial_leg = _Leg(key, 0, self.plotter.plot(self.initial_orbit, self.craft))
+
+        orbit = self.initial_orbit
+
+        for i, maneuver in enumerate(self.__maneuvers):
+            leg = self.__legs[i]
+            key = (body_key, craft_key, self.__describe_orbit(orbit), self.__describe_orbit(maneuver.target_orbit), maneuver.color)
+
+            # Recompute and replot the leg if it changed
+            if leg is None or leg.key != key:
+                if leg is not None:
+                    self.__remove_artists(leg)
+
+                # Forget the old leg first so that it is computed again next time if plotting fails
+                self.__legs[i] = None
+                delta_v = maneuver.calculate_delta_v(orbit, body)
+                self.__legs[i] = _Leg(key, delta_v, self.plotter.plot_maneuver(orbit, self.craft, maneuver))
+
+                updated.append(i)
+
+            orbit = maneuver.target_orbit
+
+        # Update the legend and redraw if anything changed, showing the maneuver labels every leg repeats only once
+        if replot_initial_orbit or updated:
+            self.plotter.refresh(True)
+
+        return updated
+
+    '''
+    Private helper function that removes the plotted artists of the given leg
+    '''
+    def __remove_artists(self, leg):
+        for artist in leg.artists:
+            artist.remove()
+
+        leg.artists = []
+
+    '''
+    Private helper function that returns the apogee, perigee, and inclination of the given orbit as a tuple
+    '''
+    def __describe_orbit(self, orbit):
+        return (orbit.apogee, orbit.perigee, orbit.inclination)
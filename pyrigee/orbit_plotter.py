@@ -47,10 +47,17 @@ class OrbitPlotter:
         # Create string to hold text that will be shown on side of screen
         self.__info_text = ""
 
+        # The wireframe of the body, kept so that it can be replaced instead of plotted again on top of itself
+        self.__body_artist = None
+
         # Standard matplotlib initialization items
         self.__fig = plt.figure("Pyrigee")
         self.__ax = self.__fig.add_subplot(111, projection = "3d")
 
+        # Remember the figure's margins before any layout is done so that clear() can restore them
+        subplot_params = self.__fig.subplotpars
+        self.__subplot_params = {"left": subplot_params.left, "right": subplot_params.right, "bottom": subplot_params.bottom, "top": subplot_params.top}
+
         # Set default view to see planet from convenient angle
         self.__ax.view_init(azim = 45, elev = 20)
         
@@ -99,32 +106,40 @@ class OrbitPlotter:
         self.__ax.set_ylim(-scaled_radius - graph_offset, scaled_radius + graph_offset)
         self.__ax.set_zlim(-scaled_radius, scaled_radius)
 
+        # Remove the previously plotted body so that wireframes don't pile up when plotting many times
+        if self.__body_artist is not None:
+            self.__body_artist.remove()
+
         # Plot the body on 3D __axis
-        self.__ax.plot_wireframe(x, y, z, color = self.body.color)
+        self.__body_artist = self.__ax.plot_wireframe(x, y, z, color = self.body.color)
 
     '''
     Private helper function that will plot apogee text given lists of x, y, and z coords, 
-    the text to plot at the apogee, and the color of the apogee point to plot
+    the text to plot at the apogee, and the color of the apogee point to plot. Returns the plotted artists
     '''
     def __plot_apogee_text(self, x, y, z, color):
         # Get coordinates for apogee text
         apogee_x_coord, apogee_y_coord, apogee_z_coord = self.__calculator.calculate_apogee_text_coords(x, y, z)
 
         # Plot point and text at apogee
-        self.__ax.scatter(apogee_x_coord, apogee_y_coord, apogee_z_coord, color = color)
-        self.__ax.text(apogee_x_coord, apogee_y_coord + self.__APSIS_LABEL_OFFSET, apogee_z_coord + self.__APSIS_LABEL_OFFSET, self.__APOGEE_LABEL, color = "white")
+        point = self.__ax.scatter(apogee_x_coord, apogee_y_coord, apogee_z_coord, color = color)
+        text = self.__ax.text(apogee_x_coord, apogee_y_coord + self.__APSIS_LABEL_OFFSET, apogee_z_coord + self.__APSIS_LABEL_OFFSET, self.__APOGEE_LABEL, color = "white")
+
+        return [point, text]
 
     '''
     Private helper function that will plot perigee text given lists of x, y, and z coords, 
-    the text to plot at the perigee, and the color of the perigee point to plot
+    the text to plot at the perigee, and the color of the perigee point to plot. Returns the plotted artists
     '''
     def __plot_perigee_text(self, x, y, z, color):
         # Get perigee coordinates for plotting
         perigee_x_coord, perigee_y_coord, perigee_z_coord = self.__calculator.calculate_perigee_text_coords(x, y, z)
 
         # Plot point and text at perigee
-        self.__ax.scatter(perigee_x_coord, perigee_y_coord, perigee_z_coord, color = color)
-        self.__ax.text(perigee_x_coord, perigee_y_coord + self.__APSIS_LABEL_OFFSET, perigee_z_coord + self.__APSIS_LABEL_OFFSET, self.__PERIGEE_LABEL, color = "white")
+        point = self.__ax.scatter(perigee_x_coord, perigee_y_coord, perigee_z_coord, color = color)
+        text = self.__ax.text(perigee_x_coord, perigee_y_coord + self.__APSIS_LABEL_OFFSET, perigee_z_coord + self.__APSIS_LABEL_OFFSET, self.__PERIGEE_LABEL, color = "white")
+
+        return [point, text]
 
     '''
     Private helper function that plots elliptical orbits when eccentricity is between 0 and 1.
@@ -136,7 +151,7 @@ class OrbitPlotter:
     be graphed backwards (used in plotting certain cases of transfers). in_between indicates whether or not
     the current plot should be a dashed line; used when the orbit being plotted is an in-between orbit.
     label is used to set the legend text for this particular orbit if it needs to be different from
-    the default
+    the default. Returns the plotted artists
     '''
     def __plot_elliptical_orbit(self, orbit, craft, eccentricity, semi_major_axis, transfer = False, plot_labels = True, legend = True, negative = False, in_between = False, label = None):
         # Get coordinates of elliptical orbit
@@ -158,45 +173,50 @@ class OrbitPlotter:
             linestyle = "dotted"
 
         # Plot the orbit after scaling x and y coords to display in the correct units on graph
-        orbit = self.__ax.plot(x, y, z, zdir = "z", color = craft.color, label = label, linestyle = linestyle)
+        artists = self.__ax.plot(x, y, z, zdir = "z", color = craft.color, label = label, linestyle = linestyle)
 
         # If plot_labels is true, plot points and labels at orbit's apogee and perigee
         if plot_labels:
             # Plot the apogee and apogee point of this orbit
-            self.__plot_apogee_text(x, y, z, craft.color)
+            artists += self.__plot_apogee_text(x, y, z, craft.color)
 
             # Plot the perigee and perigee point of this orbit
-            self.__plot_perigee_text(x, y, z, craft.color)
+            artists += self.__plot_perigee_text(x, y, z, craft.color)
+
+        return artists
 
     '''
     Private helper function that plots parabolic orbits when the eccentricity is very close to 1. Takes
     the orbit and craft to plot, as well as the semi-major axis of the orbit (calculated elsewhere to
-    reduce redundant code)
+    reduce redundant code). Returns the plotted artists
     '''
     def __plot_parabolic_orbit(self, orbit, craft, semi_major_axis):
         # Get coordinates for plotting parabolic orbit
         x, y, z = self.__calculator.calculate_parabolic_orbit_coords(orbit, self.body.radius)
 
         # Plot the orbit after scaling x and y coords to display in the correct units on graph
-        self.__ax.plot(x, y, z, zdir = "z", color = craft.color, label = craft.name)
+        artists = self.__ax.plot(x, y, z, zdir = "z", color = craft.color, label = craft.name)
 
         # Plot the perigee and perigee point of this orbit
-        self.__plot_perigee_text(x, y, z, craft.color)
+        artists += self.__plot_perigee_text(x, y, z, craft.color)
+
+        return artists
 
     '''
     Private method that plots a Hohmann transfer orbit. Takes the initial orbit,
-    the craft orbiting, and the target orbit
+    the craft orbiting, and the target orbit. Returns the plotted artists
     '''
     def __plot_hohmann_transfer_orbit(self, initial_orbit, craft, target_orbit):
         # Calculate the transfer orbit elements
         transfer_orbit, transfer_eccentricity, transfer_semi_major_axis = self.__calculator.calculate_transfer_orbit_elements(initial_orbit, target_orbit, self.body.radius)
 
         # Plot half of an elliptical orbit to plot the Hohmann transfer orbit
-        self.__plot_elliptical_orbit(transfer_orbit, craft, transfer_eccentricity, transfer_semi_major_axis, True, False, True, False, False, f"{craft.name} transfer")
+        return self.__plot_elliptical_orbit(transfer_orbit, craft, transfer_eccentricity, transfer_semi_major_axis, True, False, True, False, False, f"{craft.name} transfer")
 
     '''
     Private method that plots the arrow indicating an inclination change. Does not change the info
-    text or deal directly with the maneuver. Takes the orbiting craft and the initial and target orbits
+    text or deal directly with the maneuver. Takes the orbiting craft and the initial and target orbits.
+    Returns the plotted artists
     '''
     def __plot_ascending_node(self, craft, initial_orbit, target_orbit):
         # Variables that will store the value of the highest apogee/perigee between the initial and target orbits
@@ -218,11 +238,12 @@ class OrbitPlotter:
         x, y, z = self.__calculator.calculate_ascending_node_coords(self.body.radius, initial_orbit.inclination, highest_apogee, highest_perigee)
 
         # Plot an arrow indicating direction of inclination change
-        self.__ax.plot(x, y, z, marker = self.__ASCENDING_NODE_LABEL, markersize = 10, color = craft.color, label = f"{craft.name} ascending node")
+        return self.__ax.plot(x, y, z, marker = self.__ASCENDING_NODE_LABEL, markersize = 10, color = craft.color, label = f"{craft.name} ascending node")
 
     '''
     Private method that plots the in-between orbit when an inclination change is present. An in-between orbits
-    attempts to show the result of inclination changes so that complicated maneuvers are easier to understand
+    attempts to show the result of inclination changes so that complicated maneuvers are easier to understand.
+    Returns the plotted artists
     '''
     def __plot_in_between_orbit(self, craft, initial_orbit, target_orbit):
         # Get in-between orbit elements
@@ -239,25 +260,27 @@ class OrbitPlotter:
             label = f"{craft.name} before inclination change"
 
         # Plot an in-between orbit that shows where a spacecraft will be after an inclination change. Intended to make orbit path clearer
-        self.__plot_elliptical_orbit(in_between_orbit, craft, in_between_eccentricity, in_between_semi_major_axis, False, False, True, False, True, label)
+        return self.__plot_elliptical_orbit(in_between_orbit, craft, in_between_eccentricity, in_between_semi_major_axis, False, False, True, False, True, label)
 
     '''
     Private helper function that calls the correct plotting function to plot the given manuever. Takes 
     the initial orbit, the orbiting craft making the transfer, and the manuever. Also changes the info text
-    based on what combination of maneuvers was done
+    based on what combination of maneuvers was done. Returns the plotted artists
     '''
     def __plot_maneuver(self, initial_orbit, craft, maneuver):
         # Create custom craft for manuevering to ensure correct appearance of transfer in plot
         maneuver_craft = Craft(craft.name, maneuver.color)
 
+        artists = []
+
         # If there is a change in the orbit radius (more extensive checking is done in manuever class)
         if maneuver.target_orbit.apogee != initial_orbit.apogee:
-            self.__plot_hohmann_transfer_orbit(initial_orbit, maneuver_craft, maneuver.target_orbit)
+            artists += self.__plot_hohmann_transfer_orbit(initial_orbit, maneuver_craft, maneuver.target_orbit)
 
         # If there is an inclination difference, plot the ascending node indicator
         if initial_orbit.inclination != maneuver.target_orbit.inclination:
             # Plot ascending node
-            self.__plot_ascending_node(maneuver_craft, initial_orbit, maneuver.target_orbit)
+            artists += self.__plot_ascending_node(maneuver_craft, initial_orbit, maneuver.target_orbit)
         
         # Set message of info text depending on what combination of maneuvers was done
         # If there was both an inclination change and orbit radius change (and plot an in-between orbit)
@@ -265,7 +288,7 @@ class OrbitPlotter:
             maneuver_message = "Hohmann Transfer (with inclination change)"
 
             # Plot in-between orbit
-            self.__plot_in_between_orbit(maneuver_craft, initial_orbit, maneuver.target_orbit)
+            artists += self.__plot_in_between_orbit(maneuver_craft, initial_orbit, maneuver.target_orbit)
         
         # If there was only an orbit change
         elif initial_orbit.inclination == maneuver.target_orbit.inclination and initial_orbit.apogee != maneuver.target_orbit.apogee:
@@ -275,11 +298,42 @@ class OrbitPlotter:
         else:
             maneuver_message = "Inclination Change"
 
+        return artists
+
+    '''
+    Function to plot a maneuver and the orbit it transfers into, without plotting the orbit it starts from. Takes
+    the orbit the maneuver starts from, the craft making the maneuver, and the maneuver. Returns a list of the
+    matplotlib artists that were plotted. If plotting fails, anything already plotted is removed before the error
+    is raised
+    '''
+    def plot_maneuver(self, orbit, craft, maneuver):
+        # Maneuvers can't start from an escape orbit, even when the orbit wasn't plotted with plot() first
+        if self.__is_escape_orbit(orbit):
+            raise ValueError("Cannot perform manuevers when in parabolic escape orbit")
+
+        artists = self.__plot_maneuver(orbit, craft, maneuver)
+
+        # Create transferred orbit to plot after plotting transfer
+        transferred_orbit = Orbit(maneuver.target_orbit.apogee, maneuver.target_orbit.perigee, maneuver.target_orbit.inclination)
+
+        # After plotting manuever, plot orbit transferred into
+        try:
+            artists += self.plot(transferred_orbit, craft, None, False, False, True)
+        except Exception:
+            # Don't leave half of the maneuver on the plot (e.g. when transferring into an escape orbit)
+            for artist in artists:
+                artist.remove()
+
+            raise
+
+        return artists
+
     '''
     Function to plot crafts and orbits. Takes an orbit and craft to plot. If given a manuever, the maneuver
     will be plotted. plot_labgels indicates whether or not apogee/perigee lables will be plotted. legend indicates
     whether or not the legend should be plotted. The target orbit flag indicates whether or not this function is being
-    used to plot a target orbit after a maneuver
+    used to plot a target orbit after a maneuver. Returns a list of the matplotlib artists that were plotted, not
+    including the body
     '''
     def plot(self, orbit, craft, maneuver = None, plot_labels = True, legend = True, target_orbit = False):
         # Plot the given body
@@ -299,37 +353,129 @@ class OrbitPlotter:
         eccentricity = (apoapsis - periapsis) / (apoapsis + periapsis)
 
         # If eccentricity is sufficiently close to 1, plot a parabolic orbit
-        if (1 - eccentricity < self.__EPSILON_E):
+        if self.__is_escape_orbit(orbit):
             # If an elliptical orbit should be plotted but there is a maneuver or this is the target orbit of a maneuver, throw ValueError
             if maneuver or target_orbit:
                 raise ValueError("Cannot perform manuevers when in parabolic escape orbit")
 
-            self.__plot_parabolic_orbit(orbit, craft, semi_major_axis)
+            artists = self.__plot_parabolic_orbit(orbit, craft, semi_major_axis)
         
         # If the eccentricity is sufficiently less than 1, plot an elliptical orbit
         else:
-            self.__plot_elliptical_orbit(orbit, craft, eccentricity, semi_major_axis, False, plot_labels, legend)
+            artists = self.__plot_elliptical_orbit(orbit, craft, eccentricity, semi_major_axis, False, plot_labels, legend)
 
-        # If user included a manuever, plot the manuever
+        # If user included a manuever, plot the manuever and the orbit transferred into
         if maneuver != None:
-            self.__plot_maneuver(orbit, craft, maneuver)
+            try:
+                artists += self.plot_maneuver(orbit, craft, maneuver)
+            except Exception:
+                # Don't leave the initial orbit on the plot without its maneuver
+                for artist in artists:
+                    artist.remove()
 
-            # Create transferred orbit to plot after plotting transfer
-            transferred_orbit = Orbit(maneuver.target_orbit.apogee, maneuver.target_orbit.perigee, maneuver.target_orbit.inclination)
-
-            # After plotting manuever, plot orbit transferred into
-            self.plot(transferred_orbit, craft, None, False, False, True)
+                raise
 
         # Show legend for orbits of given craft if user wants to show legend
         if legend:
-            self.__ax.legend(facecolor = "k", framealpha = 0, labelcolor = "white")
+            self.__show_legend()
 
         # Set title to indicate the main body
         self.__ax.set_title(f"Orbit around {self.body.name}", color = "white")
 
+        return artists
+
+    '''
+    Private helper function that returns whether the eccentricity of the given orbit is close enough to 1 for it
+    to be plotted as a parabolic escape orbit
+    '''
+    def __is_escape_orbit(self, orbit):
+        apoapsis = orbit.apogee + self.body.radius
+        periapsis = orbit.perigee + self.body.radius
+        eccentricity = (apoapsis - periapsis) / (apoapsis + periapsis)
+
+        return 1 - eccentricity < self.__EPSILON_E
+
+    '''
+    Private helper function that shows the legend for everything plotted. If merge_labels is true, labels shared
+    by more than one artist are only shown once
+    '''
+    def __show_legend(self, merge_labels = False):
+        handles, labels = self.__ax.get_legend_handles_labels()
+
+        if merge_labels:
+            merged_handles = {}
+
+            for handle, label in zip(handles, labels):
+                merged_handles.setdefault(label, handle)
+
+            handles = list(merged_handles.values())
+            labels = list(merged_handles.keys())
+
+        self.__ax.legend(handles, labels, facecolor = "k", framealpha = 0, labelcolor = "white")
+
+    '''
+    Function to update the legend and redraw the figure after plotted artists have been removed (with their
+    remove() method) or replaced. If merge_labels is true, labels repeated by many orbits (such as the transfers
+    of a long mission) are only shown once in the legend, which keeps it readable and quick to draw
+    '''
+    def refresh(self, merge_labels = False):
+        self.__show_legend(merge_labels)
+        self.__fig.canvas.draw_idle()
+
     '''
     Function to show the matplotlib window
     '''
     def visualize(self):
         plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        plt.show()
+
+    '''
+    Function to save the plot to an image instead of showing it in a window. Takes a file name or a file-like
+    object, and optionally the image format (e.g. "png" or "svg") when it can't be guessed from the file name
+    '''
+    def save(self, file, image_format = None):
+        '''
+        Draw before laying out the figure. tight_layout() measures the 3D axes by where their ticks were last
+        drawn, so without a draw the layout would depend on whatever the figure showed before
+        '''
+        self.__fig.canvas.draw()
+        self.__fig.tight_layout()
+        self.__fig.savefig(file, format = image_format, facecolor = self.__fig.get_facecolor())
+
+    '''
+    Function to remove everything that has been plotted while keeping the styling of the figure, so that the
+    plotter can be reused for a new plot without paying for its setup again. Optionally takes a new Body to
+    plot orbits around
+    '''
+    def clear(self, b = None):
+        if b is not None:
+            self.body = b
+
+        # Remove orbits, points, labels, and the body
+        for artist in list(self.__ax.lines) + list(self.__ax.collections) + list(self.__ax.texts):
+            artist.remove()
+
+        self.__body_artist = None
+
+        # Remove legend if one was shown
+        legend = self.__ax.get_legend()
+
+        if legend is not None:
+            legend.remove()
+
+        self.__ax.set_title("")
+
+        '''
+        Restore the margins the figure started with. tight_layout() starts from the current margins, so leaving
+        the last plot's margins in place would make the next image depend on what was plotted before
+        '''
+        self.__fig.subplots_adjust(**self.__subplot_params)
+
+        # Plot the body again, which also resets the graph limits
+        self.__plot_body()
+
+    '''
+    Function to close the matplotlib figure when the plot is no longer needed
+    '''
+    def close(self):
+        plt.close(self.__fig)
@@ -4,6 +4,7 @@ File containing the PlottingCalculator class
 import numpy as np
 import math
 from pyrigee.orbit import *
+from pyrigee import kernels
 
 '''
 The PlottingCalculator class contains functions that calculate coordinates for plotting
@@ -27,15 +28,8 @@ class PlottingCalculator:
         # Create theta and phi values that run from 0 to 2pi and 0 to pi, respectively
         theta, phi = np.mgrid[0:2 * np.pi:self.__PLANET_DIVS, 0:np.pi:self.__PLANET_DIVS]
 
-        '''
-        Calculate x, y, and z of sphere given theta and phi ranges. Divide each radius by tick value to make sure
-        that the units are correct when displayed
-        '''
-        x = scaled_radius * np.cos(theta) * np.sin(phi) 
-        y = scaled_radius * np.sin(theta) * np.sin(phi)
-        z = scaled_radius * np.cos(phi)
-
-        return (x, y, z)
+        # Calculate x, y, and z of sphere given theta and phi ranges
+        return kernels.body_coords(theta, phi, scaled_radius)
 
     '''
     Calculates the coordinates of an elliptical orbit. Takes the orbits inclination, eccentricty, and semi-major axis.
@@ -54,22 +48,10 @@ class PlottingCalculator:
         theta = np.linspace(pi_multiplier * np.pi, 0, self.__ORBIT_DIVS)
 
         # Convert inclination to radians
-        inclination = np.radians(inclination)
-
-        # Polar equation of ellipse
-        r = (semi_major_axis * (1 - eccentricity**2)) / (1 - eccentricity * np.cos((theta)))
+        inclination = math.radians(inclination)
 
-        # Flip orbit if negative flag is true
-        if negative:
-            r *= -1
-
-        # Convert polar equations to cartesean coords based on the given orbital inclination
-        x = r * np.cos(theta) * np.cos(inclination)
-        y = r * np.sin(theta)
-        z = x * np.tan(inclination)
-        
         # Return the scaled coordinates of the elliptical orbit
-        return self.calculate_scaled_coords(x, y, z)
+        return kernels.elliptical_orbit_coords(theta, inclination, eccentricity, semi_major_axis, negative, self.__tick_value)
 
     '''
     Calculates the coordinates of a parabolic orbit. Takes an orbit object representing the orbit and the radius of the
@@ -79,16 +61,8 @@ class PlottingCalculator:
         # Create theta value for periodic plotting
         theta = np.linspace(0, 2 * np.pi, self.__ORBIT_DIVS)
 
-        # Polar equation of ellipse
-        r = ((orbit.perigee) * 2 + (body_radius * 2)) / (1 - np.cos(theta))
-
-        # Convert polar equations to cartesean coords based on the given orbital inclination
-        x = r * np.cos(theta) * np.cos(np.radians(orbit.inclination))
-        y = r * np.sin(theta)
-        z = r * np.sin(np.radians(orbit.inclination)) * np.cos(theta)
-
         # Return the scaled coordinates of the parabolic orbit
-        return self.calculate_scaled_coords(x, y, z)
+        return kernels.parabolic_orbit_coords(theta, orbit.perigee, body_radius, math.radians(orbit.inclination), self.__tick_value)
 
     '''
     Calculates the coordinates of the ascending node. Takes the radius of the body being orbited, the orbits
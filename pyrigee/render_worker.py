@@ -0,0 +1,356 @@
+'''
+File containing definitions of the RenderWorker and RenderPool classes, which keep warm processes ready to render
+scenes to image bytes, and functions for serving them over stdin or a local socket
+'''
+import concurrent.futures
+import io
+import json
+import multiprocessing
+import os
+import signal
+import socketserver
+import stat
+import subprocess
+import sys
+import threading
+import time
+from pyrigee.orbit_plotter import *
+from pyrigee.scenario import parse_scenario, use_headless_backend
+
+__all__ = ["RenderWorker", "RenderPool"]
+
+'''
+Scene rendered by each worker process when it starts, and by the benchmark
+'''
+SAMPLE_SCENE = {
+    "body": "EARTH",
+    "plots": [
+        {
+            "orbit": "EQUATORIAL_ORBIT",
+            "craft": {"name": "Satellite", "color": "lime"},
+            "maneuver": {"target_orbit": "GEOSTATIONARY_ORBIT", "color": "firebrick"}
+        }
+    ]
+}
+
+'''
+Class that renders scenes in the current process. One OrbitPlotter is created and styled on the first render
+and cleared for each later render, so only the first render pays for setting up the figure
+'''
+class RenderWorker:
+    def __init__(self):
+        self.__plotter = None
+
+    '''
+    Renders the given scene description (in the same format as a scenario file) to an image in the given format.
+    Returns the image bytes, the number of seconds the render took, and whether this was a cold render that had
+    to set up the figure
+    '''
+    def render(self, scene, image_format = "png"):
+        start = time.perf_counter()
+
+        scenario = parse_scenario(scene, "scene")
+        cold = self.__plotter is None
+
+        # Set up the figure on the first render, and reuse it afterwards
+        if cold:
+            use_headless_backend()
+            self.__plotter = OrbitPlotter(scenario.body)
+        else:
+            self.__plotter.clear(scenario.body)
+
+        for orbit, craft, maneuver in scenario.plots:
+            self.__plotter.plot(orbit, craft, maneuver)
+
+        buffer = io.BytesIO()
+        self.__plotter.save(buffer, image_format)
+
+        return (buffer.getvalue(), time.perf_counter() - start, cold)
+
+# The RenderWorker of the current pool process, how long its warm-up render took, and the barrier that makes
+# every pool process report its warm-up
+_worker = None
+_cold_time = None
+_start_barrier = None
+
+'''
+Initializer of pool processes. Creates the process's RenderWorker and warms it up by rendering the sample scene,
+so that requests never see a cold render. Remembers how long the warm-up took
+'''
+def _init_worker(start_barrier):
+    global _worker, _cold_time, _start_barrier
+
+    # Leave Ctrl-C to the serving process, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _start_barrier = start_barrier
+    _worker = RenderWorker()
+    _cold_time = _worker.render(SAMPLE_SCENE)[1]
+
+'''
+Returns the ID of the current pool process and how long its warm-up render took. Waits for every pool process to
+get here, so that no process takes more than one of these tasks
+'''
+def _get_cold_time():
+    _start_barrier.wait()
+
+    return (os.getpid(), _cold_time)
+
+'''
+Renders a scene with the current pool process's RenderWorker
+'''
+def _render(scene, image_format):
+    return _worker.render(scene, image_format)
+
+'''
+Class that keeps a pool of warm RenderWorker processes to serve concurrent render requests
+'''
+class RenderPool:
+    '''
+    Init function takes the number of worker processes (one per CPU if None). Starts and warms up every process
+    before returning
+    '''
+    def __init__(self, processes = None):
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        self.__processes = processes
+
+        # Guards replacing the executor when a worker process dies
+        self.__lock = threading.Lock()
+
+        self.__executor = self.__start()
+
+    '''
+    Private helper function that starts a new executor and warms up every one of its processes. Sets cold_times to
+    a map of process ID to the number of seconds its cold render took, and returns the executor
+    '''
+    def __start(self):
+        start_barrier = multiprocessing.Barrier(self.__processes)
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers = self.__processes, initializer = _init_worker, initargs = (start_barrier,))
+
+        # Submitting one task per process at once starts every process now instead of on the first requests
+        futures = [executor.submit(_get_cold_time) for i in range(self.__processes)]
+
+        try:
+            self.cold_times = dict(future.result() for future in futures)
+        except BaseException:
+            executor.shutdown(wait = False)
+            raise
+
+        return executor
+
+    '''
+    Private helper function that replaces the given executor with a new, warmed up one if a worker process died and
+    broke it. Does nothing if the executor was already replaced. Returns the current executor
+    '''
+    def __restart(self, broken_executor):
+        with self.__lock:
+            if self.__executor is broken_executor:
+                broken_executor.shutdown(wait = False)
+                self.__executor = self.__start()
+
+            return self.__executor
+
+    '''
+    Submits a render request and returns a future. A request is a dictionary with the scene description under
+    "scene", and optionally an "id" that is copied to the response and an image "format" (png by default). The
+    future's result is a tuple of the response header dictionary and the image bytes
+    '''
+    def submit(self, request):
+        start = time.perf_counter()
+        response_future = concurrent.futures.Future()
+
+        # Respond to requests that can't be rendered without sending them to a worker
+        if not isinstance(request, dict) or not isinstance(request.get("scene"), dict):
+            header = {"id": request.get("id") if isinstance(request, dict) else None, "status": "error", "error": "Request must be a table with a 'scene' table", "length": 0}
+            response_future.set_result((header, b""))
+            return response_future
+
+        header = {"id": request.get("id")}
+        executor = self.__executor
+
+        try:
+            try:
+                render_future = executor.submit(_render, request["scene"], request.get("format", "png"))
+            except concurrent.futures.process.BrokenProcessPool:
+                # A worker process died since the last request, so retry on a new pool
+                executor = self.__restart(executor)
+                render_future = executor.submit(_render, request["scene"], request.get("format", "png"))
+        except Exception as e:
+            header.update({"status": "error", "error": str(e), "length": 0})
+            response_future.set_result((header, b""))
+            return response_future
+
+        def respond(future):
+            try:
+                image, render_time, cold = future.result()
+            except Exception as e:
+                header.update({"status": "error", "error": str(e), "length": 0})
+                response_future.set_result((header, b""))
+
+                '''
+                The worker process died while rendering this request. It isn't retried since the scene may be what
+                killed it, but the pool is replaced so that later requests can be served
+                '''
+                if isinstance(e, concurrent.futures.process.BrokenProcessPool):
+                    self.__restart(executor)
+
+                return
+
+            header.update({"status": "ok", "length": len(image), "cold": cold, "render_time": render_time, "latency": time.perf_counter() - start})
+            response_future.set_result((header, image))
+
+        render_future.add_done_callback(respond)
+
+        return response_future
+
+    '''
+    Stops the worker processes after finishing any requests that were already submitted
+    '''
+    def shutdown(self):
+        with self.__lock:
+            self.__executor.shutdown()
+
+'''
+Returns the bytes of a response, which is a single line of JSON followed by the number of image bytes given by
+the "length" field of the header
+'''
+def _encode_response(header, image):
+    return json.dumps(header).encode("utf-8") + b"\n" + image
+
+'''
+Parses a line holding a JSON request. Returns None if the line isn't valid JSON, which the pool answers with an
+error response
+'''
+def _decode_request(line):
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+'''
+Serves render requests read from stdin, one JSON request per line, until stdin is closed. Responses are written
+to stdout as soon as they are rendered, so they may be out of order; use request IDs to match them up
+'''
+def serve_stdin(pool):
+    output = sys.stdout.buffer
+    lock = threading.Lock()
+
+    def write(future):
+        with lock:
+            output.write(_encode_response(*future.result()))
+            output.flush()
+
+    futures = []
+
+    for line in sys.stdin.buffer:
+        if line.strip():
+            future = pool.submit(_decode_request(line))
+            future.add_done_callback(write)
+            futures.append(future)
+
+    concurrent.futures.wait(futures)
+
+'''
+Request handler for socket connections. Each connection can send any number of requests, which are answered in
+order; open more connections to render concurrently
+'''
+class _RenderRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(_encode_response(*self.server.pool.submit(_decode_request(line)).result()))
+                self.wfile.flush()
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+# Unix sockets are only available on Unix
+if hasattr(socketserver, "UnixStreamServer"):
+    class _ThreadingUnixStreamServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+'''
+Parses a socket address, either "host:port" for a TCP socket or a file path for a Unix socket. Returns a tuple of
+the host and port for TCP sockets, or the path for Unix sockets. Raises ValueError if the address isn't valid
+'''
+def parse_address(address):
+    if ":" in address and "/" not in address:
+        host, port = address.rsplit(":", 1)
+
+        if not port.isdigit() or int(port) > 65535:
+            raise ValueError(f"Invalid port '{port}' in address '{address}'")
+
+        return (host, int(port))
+
+    if not hasattr(socketserver, "UnixStreamServer"):
+        raise ValueError(f"Unix sockets aren't supported on this platform; use host:port instead of '{address}'")
+
+    return address
+
+'''
+Serves render requests over a local socket until interrupted. Takes the pool and an address, either "host:port"
+for a TCP socket or a file path for a Unix socket
+'''
+def serve_socket(pool, address):
+    address = parse_address(address)
+
+    if isinstance(address, tuple):
+        server = _ThreadingTCPServer(address, _RenderRequestHandler)
+    else:
+        # Remove a socket file left behind by a server that didn't shut down cleanly
+        try:
+            if stat.S_ISSOCK(os.stat(address).st_mode):
+                os.unlink(address)
+        except FileNotFoundError:
+            pass
+
+        server = _ThreadingUnixStreamServer(address, _RenderRequestHandler)
+
+    server.pool = pool
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+        # Unix socket files aren't removed when the socket is closed
+        if not isinstance(address, tuple):
+            try:
+                os.unlink(address)
+            except FileNotFoundError:
+                pass
+
+'''
+Compares the latency of a cold render, which starts a new Python process and sets everything up as a one-off call
+to pyrigee does, with warm renders served by a RenderPool. Takes the number of warm renders to average. Returns a
+tuple of the cold latency and the mean warm latency in seconds
+'''
+def benchmark(renders = 20):
+    request = json.dumps({"scene": SAMPLE_SCENE})
+
+    # Cold render in a new interpreter
+    code = "import sys, json; from pyrigee.render_worker import RenderWorker; RenderWorker().render(json.loads(sys.stdin.read())['scene'])"
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], input = request.encode("utf-8"), check = True)
+    cold_latency = time.perf_counter() - start
+
+    # Warm renders from a pool that has already been started
+    pool = RenderPool(1)
+
+    try:
+        start = time.perf_counter()
+
+        for i in range(renders):
+            header, image = pool.submit({"scene": SAMPLE_SCENE}).result()
+
+            if header["status"] != "ok":
+                raise RuntimeError(header["error"])
+
+        warm_latency = (time.perf_counter() - start) / renders
+    finally:
+        pool.shutdown()
+
+    return (cold_latency, warm_latency)
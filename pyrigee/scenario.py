@@ -0,0 +1,338 @@
+'''
+File containing definition of Scenario class and functions for loading and rendering scenario files
+'''
+import concurrent.futures
+import hashlib
+import json
+import os
+import time
+import matplotlib
+import pyrigee
+import pyrigee.body
+import pyrigee.craft
+import pyrigee.orbit
+from pyrigee.body import *
+from pyrigee.craft import *
+from pyrigee.maneuver import *
+from pyrigee.orbit import *
+from pyrigee.orbit_plotter import *
+
+# TOML support comes from the standard library on Python 3.11+, or from the tomli package if it is installed
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+__all__ = ["Scenario", "load_scenarios", "run_scenarios"]
+
+'''
+Name of the file in the output directory that remembers which scenarios have already been rendered
+'''
+CACHE_FILE_NAME = ".pyrigee_cache.json"
+
+'''
+File extensions that are read as scenario files when given a directory
+'''
+SCENARIO_EXTENSIONS = (".json", ".toml")
+
+'''
+Class used for describing everything needed to render one plot: a body and the orbits, crafts, and maneuvers
+plotted around it
+'''
+class Scenario:
+    '''
+    Init function takes the scenario's name, the Body that all orbits will be plotted around, and a list of
+    plots. Each plot is a tuple of an Orbit, a Craft, and a Maneuver (or None if there is no maneuver)
+    '''
+    def __init__(self, n, b, p):
+        self.name = n
+        self.body = b
+        self.plots = p
+
+    '''
+    Returns a hash of everything that affects the rendered image of this scenario, including the version of
+    pyrigee so that images are rendered again after upgrading. Takes the image format the scenario will be
+    rendered to
+    '''
+    def get_hash(self, image_format):
+        plots = []
+
+        for orbit, craft, maneuver in self.plots:
+            maneuver_description = None
+
+            if maneuver is not None:
+                maneuver_description = [_describe_orbit(maneuver.target_orbit), maneuver.color]
+
+            plots.append([_describe_orbit(orbit), [craft.name, craft.color], maneuver_description])
+
+        body = [self.body.name, self.body.mass, self.body.radius, self.body.color]
+        description = json.dumps([pyrigee.__version__, image_format, body, plots], sort_keys = True)
+
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+'''
+Returns the apogee, perigee, and inclination of the given orbit as a list
+'''
+def _describe_orbit(orbit):
+    return [orbit.apogee, orbit.perigee, orbit.inclination]
+
+'''
+Resolves a value from a scenario file into an object. Strings are looked up as named constants (such as EARTH
+or GEOSTATIONARY_ORBIT) in the given module, and tables are passed to the given class's init function using the
+given field names in order. kind is the name used in error messages
+'''
+def _resolve(value, module, cls, fields, kind):
+    # Look up named constants
+    if isinstance(value, str):
+        constant = getattr(module, value, None)
+
+        if not isinstance(constant, cls):
+            raise ValueError(f"Unknown {kind} constant '{value}'")
+
+        return constant
+
+    # Build a new object from the fields in the table
+    if isinstance(value, dict):
+        try:
+            return cls(*[value[field] for field in fields])
+        except KeyError as e:
+            raise ValueError(f"{kind.capitalize()} is missing '{e.args[0]}'")
+        except TypeError as e:
+            # Fields of the wrong type, such as a string apogee
+            raise ValueError(f"{kind.capitalize()} has a field of the wrong type: {e}")
+
+    raise ValueError(f"Expected a {kind} constant name or table, got {value!r}")
+
+'''
+Resolves an orbit from a scenario file
+'''
+def _resolve_orbit(value):
+    return _resolve(value, pyrigee.orbit, Orbit, ("apogee", "perigee", "inclination"), "orbit")
+
+'''
+Creates a Scenario from the given dictionary, as read from a scenario file. Takes the dictionary and a name to
+use if the dictionary doesn't give one
+'''
+def parse_scenario(description, default_name):
+    if not isinstance(description, dict):
+        raise ValueError(f"Scenario '{default_name}' must be a table")
+
+    name = str(description.get("name", default_name))
+
+    # Scenarios are saved under their name, so it must not be able to point outside the output directory
+    if not name or name in (".", "..") or "/" in name or "\\" in name:
+        raise ValueError(f"Scenario name '{name}' must not be empty or contain path separators")
+
+    if "body" not in description:
+        raise ValueError(f"Scenario '{name}' is missing 'body'")
+
+    body = _resolve(description["body"], pyrigee.body, Body, ("name", "mass", "radius", "color"), "body")
+
+    plots = []
+    plot_descriptions = description.get("plots", [])
+
+    if not isinstance(plot_descriptions, list):
+        raise ValueError(f"'plots' of scenario '{name}' must be a list")
+
+    for plot in plot_descriptions:
+        if not isinstance(plot, dict) or "orbit" not in plot or "craft" not in plot:
+            raise ValueError(f"Each plot in scenario '{name}' needs an 'orbit' and a 'craft'")
+
+        orbit = _resolve_orbit(plot["orbit"])
+        craft = _resolve(plot["craft"], pyrigee.craft, Craft, ("name", "color"), "craft")
+
+        maneuver = None
+
+        # Maneuvers are optional
+        if plot.get("maneuver") is not None:
+            maneuver_description = plot["maneuver"]
+
+            if not isinstance(maneuver_description, dict) or "target_orbit" not in maneuver_description or "color" not in maneuver_description:
+                raise ValueError(f"Each maneuver in scenario '{name}' needs a 'target_orbit' and a 'color'")
+
+            maneuver = Maneuver(_resolve_orbit(maneuver_description["target_orbit"]), maneuver_description["color"])
+
+        plots.append((orbit, craft, maneuver))
+
+    return Scenario(name, body, plots)
+
+'''
+Reads the scenarios in a single JSON or TOML file. A file can either describe a single scenario, or hold a list
+of them under the "scenarios" key. Scenarios without a name are named after the file
+'''
+def _load_file(file_name):
+    stem, extension = os.path.splitext(os.path.basename(file_name))
+    extension = extension.lower()
+
+    if extension == ".json":
+        with open(file_name, "r", encoding = "utf-8") as f:
+            data = json.load(f)
+    elif extension == ".toml":
+        if tomllib is None:
+            raise ValueError(f"Reading '{file_name}' requires Python 3.11+ or the tomli package")
+
+        with open(file_name, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        raise ValueError(f"Scenario files must end in .json or .toml, got '{file_name}'")
+
+    # A file holding a single scenario
+    if not isinstance(data, dict) or "scenarios" not in data:
+        return [parse_scenario(data, stem)]
+
+    # A file holding a list of scenarios
+    if not isinstance(data["scenarios"], list):
+        raise ValueError(f"'scenarios' in '{file_name}' must be a list")
+
+    return [parse_scenario(description, f"{stem}-{i}") for i, description in enumerate(data["scenarios"])]
+
+'''
+Returns a list of the scenarios in the given path. Takes either a scenario file or a directory, in which case
+every scenario file in the directory is read in alphabetical order
+'''
+def load_scenarios(path):
+    if not os.path.isdir(path):
+        return _load_file(path)
+
+    scenarios = []
+
+    for file_name in sorted(os.listdir(path)):
+        if os.path.splitext(file_name)[1].lower() in SCENARIO_EXTENSIONS:
+            scenarios += _load_file(os.path.join(path, file_name))
+
+    return scenarios
+
+'''
+Switches matplotlib to a backend that renders without a window. Used as the initializer of render processes
+'''
+def use_headless_backend():
+    matplotlib.use("Agg")
+
+'''
+Plots the given scenario, computes the delta-v of each of its maneuvers, and saves the plot to the given file name.
+Returns a list of the delta-v (in km/s) of each maneuver and the number of seconds the render took
+'''
+def render_scenario(scenario, file_name, image_format = None):
+    start = time.perf_counter()
+
+    plotter = OrbitPlotter(scenario.body)
+    delta_vs = []
+
+    try:
+        for orbit, craft, maneuver in scenario.plots:
+            plotter.plot(orbit, craft, maneuver)
+
+            if maneuver is not None:
+                delta_vs.append(maneuver.calculate_delta_v(orbit, scenario.body))
+
+        plotter.save(file_name, image_format)
+    finally:
+        plotter.close()
+
+    return (delta_vs, time.perf_counter() - start)
+
+'''
+Reads the output cache in the given directory. Returns an empty cache if there is none or it can't be read
+'''
+def _read_cache(output_dir):
+    try:
+        with open(os.path.join(output_dir, CACHE_FILE_NAME), "r", encoding = "utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+
+    return cache
+
+'''
+Writes the output cache to the given directory
+'''
+def _write_cache(output_dir, cache):
+    with open(os.path.join(output_dir, CACHE_FILE_NAME), "w", encoding = "utf-8") as f:
+        json.dump(cache, f, indent = 2, sort_keys = True)
+
+'''
+Renders each of the given scenarios to an image in the output directory, using a pool of jobs processes (or one
+per CPU if jobs is None). Scenarios whose content hasn't changed since they were last rendered are skipped unless
+force is true. Yields a tuple for each scenario as it finishes of the scenario, its status ("rendered", "cached",
+or "failed"), the number of seconds it took, and either the list of maneuver delta-vs or the error that occurred
+'''
+def run_scenarios(scenarios, output_dir, jobs = None, image_format = "png", force = False):
+    # Each scenario is saved under its name, so names must be unique
+    names = set()
+
+    for scenario in scenarios:
+        if scenario.name in names:
+            raise ValueError(f"More than one scenario is named '{scenario.name}'")
+
+        names.add(scenario.name)
+
+    os.makedirs(output_dir, exist_ok = True)
+    cache = _read_cache(output_dir)
+
+    # Scenarios that need to be rendered, each with its hash and output file name
+    pending = []
+
+    for scenario in scenarios:
+        scenario_hash = scenario.get_hash(image_format)
+        file_name = os.path.join(output_dir, f"{scenario.name}.{image_format}")
+        entry = cache.get(scenario.name)
+
+        # Skip scenarios that were already rendered from the same content
+        if not force and isinstance(entry, dict) and entry.get("hash") == scenario_hash and os.path.exists(file_name):
+            yield (scenario, "cached", 0, entry.get("delta_v", []))
+        else:
+            pending.append((scenario, scenario_hash, file_name))
+
+    if not pending:
+        return
+
+    # Render in this process if only one job is requested, saving the cost of starting a pool
+    if jobs == 1:
+        use_headless_backend()
+        executor = None
+        results = ((item, _call(render_scenario, item[0], item[2], image_format)) for item in pending)
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers = jobs, initializer = use_headless_backend)
+        futures = {executor.submit(render_scenario, scenario, file_name, image_format): (scenario, scenario_hash, file_name) for scenario, scenario_hash, file_name in pending}
+        results = ((futures[future], future) for future in concurrent.futures.as_completed(futures))
+
+    try:
+        for (scenario, scenario_hash, file_name), future in results:
+            try:
+                delta_vs, elapsed = future.result()
+            except Exception as e:
+                # Forget failed scenarios so that they are rendered again next time
+                cache.pop(scenario.name, None)
+
+                yield (scenario, "failed", 0, e)
+                continue
+
+            cache[scenario.name] = {"hash": scenario_hash, "delta_v": delta_vs}
+
+            yield (scenario, "rendered", elapsed, delta_vs)
+    finally:
+        # Write the cache once at the end, which also saves what finished if rendering was stopped early
+        try:
+            _write_cache(output_dir, cache)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+'''
+Calls the given function with the given arguments and returns a finished future holding its result or error
+'''
+def _call(function, *args):
+    future = concurrent.futures.Future()
+
+    try:
+        future.set_result(function(*args))
+    except Exception as e:
+        future.set_exception(e)
+
+    return future
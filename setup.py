@@ -1,11 +1,16 @@
+import re
 import setuptools
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Read the version from the package so that it is only defined in one place
+with open("pyrigee/__init__.py", "r", encoding="utf-8") as fh:
+    version = re.search(r'^__version__ = "(.+)"$', fh.read(), re.MULTILINE).group(1)
+
 setuptools.setup(
     name="pyrigee",
-    version="1.0.4",
+    version=version,
     author="Jack Sheehan",
     description="A python package for visualizing spacecraft orbits and orbital maneuvers.",
     long_description=long_description,
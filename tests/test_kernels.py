@@ -0,0 +1,114 @@
+'''
+Tests that the Numba kernels give the same results as the NumPy kernels they replace
+'''
+import importlib
+import itertools
+import numpy as np
+import pytest
+from pyrigee import kernels
+from pyrigee.orbit import *
+from pyrigee.plotting_calculator import *
+
+# Inputs covering flat, inclined, and steeply inclined orbits, circular to very eccentric orbits, and both tick types
+INCLINATIONS = [0, 0.5, 1.2, 1.7, -0.4]
+ECCENTRICITIES = [0, 0.3, 0.89]
+SEMI_MAJOR_AXES = [6778, 20000.5]
+TICK_VALUES = [1000, 1000.0]
+
+'''
+Reloads the kernels module with PYRIGEE_USE_NUMBA set or unset, and reloads it again with the original
+environment after the test
+'''
+@pytest.fixture
+def reload_kernels(monkeypatch):
+    def reload(use_numba):
+        if use_numba:
+            monkeypatch.setenv("PYRIGEE_USE_NUMBA", "1")
+        else:
+            monkeypatch.delenv("PYRIGEE_USE_NUMBA", raising = False)
+
+        return importlib.reload(kernels)
+
+    yield reload
+
+    monkeypatch.undo()
+    importlib.reload(kernels)
+
+'''
+The kernels module with the Numba kernels compiled. Skips the test if Numba isn't installed
+'''
+@pytest.fixture
+def numba_kernels(reload_kernels):
+    pytest.importorskip("numba")
+
+    return reload_kernels(True)
+
+'''
+Asserts that two tuples of x, y, z coordinates are the same, treating infinities and NaNs in the same places as equal
+'''
+def assert_coords_equal(expected, actual):
+    assert len(expected) == len(actual)
+
+    for expected_axis, actual_axis in zip(expected, actual):
+        np.testing.assert_allclose(actual_axis, expected_axis, rtol = 1e-12, atol = 1e-12, equal_nan = True)
+
+def test_body_coords_parity(numba_kernels):
+    theta, phi = np.mgrid[0:2 * np.pi:9j, 0:np.pi:9j]
+
+    for radius in [6.378, 695.7, 1]:
+        assert_coords_equal(numba_kernels.numpy_body_coords(theta, phi, radius), numba_kernels.numba_body_coords(theta, phi, radius))
+
+@pytest.mark.parametrize("transfer", [False, True])
+def test_elliptical_orbit_coords_parity(numba_kernels, transfer):
+    theta = np.linspace((-1 if transfer else -2) * np.pi, 0, 61)
+
+    for inclination, eccentricity, semi_major_axis, negative, tick_value in itertools.product(INCLINATIONS, ECCENTRICITIES, SEMI_MAJOR_AXES, [False, True], TICK_VALUES):
+        args = (theta, inclination, eccentricity, semi_major_axis, negative, tick_value)
+
+        assert_coords_equal(numba_kernels.numpy_elliptical_orbit_coords(*args), numba_kernels.numba_elliptical_orbit_coords(*args))
+
+def test_parabolic_orbit_coords_parity(numba_kernels):
+    theta = np.linspace(0, 2 * np.pi, 61)
+
+    for inclination, perigee, tick_value in itertools.product(INCLINATIONS, [400, 400.5], TICK_VALUES):
+        args = (theta, perigee, 6378, inclination, tick_value)
+        expected = numba_kernels.numpy_parabolic_orbit_coords(*args)
+        actual = numba_kernels.numba_parabolic_orbit_coords(*args)
+
+        # The parabola has no end, so its first point is at infinity
+        assert np.isinf(expected[0][0]) and np.isinf(actual[0][0])
+        assert_coords_equal(expected, actual)
+
+def test_numba_is_used_when_turned_on(numba_kernels):
+    assert numba_kernels.NUMBA_ENABLED
+    assert numba_kernels.elliptical_orbit_coords is numba_kernels.numba_elliptical_orbit_coords
+
+def test_numpy_is_used_by_default(reload_kernels):
+    default_kernels = reload_kernels(False)
+
+    assert not default_kernels.NUMBA_ENABLED
+    assert default_kernels.elliptical_orbit_coords is default_kernels.numpy_elliptical_orbit_coords
+
+'''
+Calculates the coordinates PlottingCalculator gives for a body, an elliptical orbit, a transfer orbit, and a
+parabolic orbit
+'''
+def calculate_coords():
+    calculator = PlottingCalculator(1000)
+
+    return [
+        calculator.calculate_body_coords(6.378),
+        calculator.calculate_elliptical_orbit_coords(45, 0.2, 12000, False, False),
+        calculator.calculate_elliptical_orbit_coords(30, 0.5, 20000, True, True),
+        calculator.calculate_parabolic_orbit_coords(Orbit(4000000000, 400, 20), 6378),
+    ]
+
+def test_plotting_calculator_with_and_without_numba(reload_kernels):
+    reload_kernels(False)
+    numpy_coords = calculate_coords()
+
+    reload_kernels(True)
+    numba_coords = calculate_coords()
+
+    for expected, actual in zip(numpy_coords, numba_coords):
+        assert_coords_equal(expected, actual)
@@ -0,0 +1,115 @@
+'''
+Tests for recomputing and replotting only the legs of a Mission that changed
+'''
+import matplotlib.pyplot as plt
+import pytest
+from pyrigee.body import *
+from pyrigee.craft import *
+from pyrigee.maneuver import *
+from pyrigee.mission import *
+from pyrigee.orbit import *
+from pyrigee.orbit_plotter import *
+from pyrigee.scenario import use_headless_backend
+
+'''
+An OrbitPlotter plotting around Earth, closed after the test
+'''
+@pytest.fixture
+def plotter():
+    use_headless_backend()
+    plotter = OrbitPlotter(EARTH)
+
+    yield plotter
+
+    plotter.close()
+
+'''
+Returns a mission that climbs through orbits of the given apogees, one maneuver per apogee
+'''
+def make_mission(plotter, apogees):
+    mission = Mission(plotter, Craft("Satellite", "lime"), Orbit(400, 400, 0))
+
+    for apogee in apogees:
+        mission.add_maneuver(Maneuver(Orbit(apogee, apogee, 0), "firebrick"))
+
+    return mission
+
+'''
+Returns the number of matplotlib artists on the plot, not including the body
+'''
+def count_artists():
+    ax = plt.figure("Pyrigee").axes[0]
+
+    return len(ax.lines) + len(ax.collections) + len(ax.texts) - 1
+
+def test_only_changed_legs_are_updated(plotter):
+    mission = make_mission(plotter, [1000, 2000, 3000, 4000])
+
+    assert mission.update() == [0, 1, 2, 3]
+    assert mission.update() == []
+
+    mission.set_maneuver(1, Maneuver(Orbit(2500, 2500, 0), "firebrick"))
+
+    assert mission.update() == [1, 2]
+    assert mission.update() == []
+
+def test_delta_v_of_legs(plotter):
+    mission = make_mission(plotter, [35786])
+
+    assert mission.get_delta_v(0) == pytest.approx(Maneuver(Orbit(35786, 35786, 0), "red").calculate_delta_v(mission.initial_orbit, EARTH))
+    assert mission.get_total_delta_v() == pytest.approx(mission.get_delta_v(0))
+
+def test_orbits_edited_in_place_are_noticed(plotter):
+    mission = make_mission(plotter, [1000, 2000, 3000])
+    mission.update()
+
+    mission.get_orbit(1).apogee = 2500
+    assert mission.update() == [1, 2]
+
+    mission.initial_orbit.inclination = 30
+    assert mission.update() == [0]
+
+def test_removing_and_inserting_legs_keeps_the_plot_consistent(plotter):
+    mission = make_mission(plotter, [1000, 2000, 3000])
+    mission.update()
+    artists_per_mission = count_artists()
+
+    mission.remove_maneuver(1)
+    assert mission.update() == [1]
+    assert count_artists() < artists_per_mission
+
+    mission.insert_maneuver(1, Maneuver(Orbit(2000, 2000, 0), "firebrick"))
+    assert mission.update() == [1, 2]
+    assert count_artists() == artists_per_mission
+
+def test_failed_leg_edits_leave_nothing_plotted(plotter):
+    mission = make_mission(plotter, [1000, 2000, 3000])
+    mission.update()
+    artists_per_mission = count_artists()
+    maneuver = mission.get_maneuvers()[1]
+
+    # Transferring into an escape orbit fails after the transfer was plotted
+    mission.set_maneuver(1, Maneuver(Orbit(4000000000, 2000, 0), "firebrick"))
+
+    with pytest.raises(ValueError):
+        mission.update()
+
+    # Restoring the maneuver replots only its leg, since the leg after it still starts from the same orbit
+    mission.set_maneuver(1, maneuver)
+
+    assert mission.update() == [1]
+    assert count_artists() == artists_per_mission
+
+def test_maneuvers_from_escape_orbits_are_rejected(plotter):
+    mission = Mission(plotter, Craft("Satellite", "lime"), Orbit(4000000000, 400, 0))
+    mission.add_maneuver(Maneuver(Orbit(35786, 35786, 0), "firebrick"))
+
+    with pytest.raises(ValueError):
+        mission.get_total_delta_v()
+
+    # Only the escape orbit itself was plotted
+    artists = count_artists()
+    plotter.clear()
+    plotter.plot(Orbit(4000000000, 400, 0), Craft("Satellite", "lime"))
+
+    assert artists == count_artists()
@@ -0,0 +1,96 @@
+'''
+Tests for rendering scenes with warm workers and the request/response protocol of RenderPool
+'''
+import io
+import json
+import os
+import signal
+import matplotlib.pyplot as plt
+import pytest
+from pyrigee.render_worker import *
+from pyrigee.render_worker import SAMPLE_SCENE, _decode_request, _encode_response
+
+# Scene with nothing plotted, which leaves the figure laid out differently from the sample scene
+EMPTY_SCENE = {"body": "MOON"}
+
+'''
+A pool with one worker process, shut down after the test
+'''
+@pytest.fixture(scope = "module")
+def pool():
+    pool = RenderPool(1)
+
+    yield pool
+
+    pool.shutdown()
+
+'''
+Reads one response from the given bytes in the way clients do: a line of JSON, then "length" image bytes. Returns
+the header, the image, and the bytes after the response
+'''
+def read_response(data):
+    stream = io.BytesIO(data)
+    header = json.loads(stream.readline())
+
+    return (header, stream.read(header["length"]), stream.read())
+
+def test_reused_worker_renders_like_a_fresh_one():
+    fresh = RenderWorker().render(SAMPLE_SCENE)
+    assert fresh[2]
+
+    # Plotters share the "Pyrigee" figure, so close it to make the next worker start from a new one
+    plt.close("all")
+
+    worker = RenderWorker()
+    worker.render(EMPTY_SCENE)
+    reused = worker.render(SAMPLE_SCENE)
+
+    assert not reused[2]
+    assert reused[0] == fresh[0]
+
+def test_responses_hold_their_image_length(pool):
+    header, image = pool.submit({"id": 7, "scene": SAMPLE_SCENE, "format": "svg"}).result()
+
+    assert (header["id"], header["status"], header["cold"]) == (7, "ok", False)
+    assert header["length"] == len(image) > 0
+    assert b"<svg" in image
+
+    # Responses written back to back can be split apart by their lengths
+    data = _encode_response(header, image) + _encode_response(*pool.submit({"id": 8, "scene": EMPTY_SCENE}).result())
+    first_header, first_image, rest = read_response(data)
+    second_header, second_image, rest = read_response(rest)
+
+    assert (first_header["id"], first_image) == (7, image)
+    assert second_header["id"] == 8 and second_image.startswith(b"\x89PNG")
+    assert rest == b""
+
+@pytest.mark.parametrize("request_line, request_id", [
+    (b"not json\n", None),
+    (b"[1, 2]\n", None),
+    (b'{"id": 1}\n', 1),
+    (b'{"id": 2, "scene": "EARTH"}\n', 2),
+    (b'{"id": 3, "scene": {"body": "NOT_A_BODY"}}\n', 3),
+    (b'{"id": 4, "scene": {"body": "EARTH", "plots": [5]}}\n', 4),
+])
+def test_malformed_requests_get_error_responses(pool, request_line, request_id):
+    header, image = pool.submit(_decode_request(request_line)).result()
+
+    assert (header["id"], header["status"], header["length"], image) == (request_id, "error", 0, b"")
+    assert header["error"]
+
+def test_pool_recovers_from_a_dead_worker():
+    pool = RenderPool(1)
+
+    try:
+        pid, = pool.cold_times
+        os.kill(pid, signal.SIGKILL)
+
+        # The request sent to the dead worker fails or is retried on a new worker, and later requests are served
+        header, image = pool.submit({"id": 1, "scene": SAMPLE_SCENE}).result()
+        assert header["status"] in ("ok", "error")
+
+        header, image = pool.submit({"id": 2, "scene": SAMPLE_SCENE}).result()
+        assert header["status"] == "ok" and len(image) == header["length"]
+        assert pid not in pool.cold_times
+    finally:
+        pool.shutdown()
@@ -0,0 +1,107 @@
+'''
+Tests for loading scenario files and rendering them with their output cache
+'''
+import json
+import os
+import pytest
+from pyrigee.body import *
+from pyrigee.maneuver import *
+from pyrigee.orbit import *
+from pyrigee.scenario import *
+from pyrigee.scenario import CACHE_FILE_NAME, parse_scenario
+
+'''
+Returns a scenario description of a transfer from low Earth orbit to geostationary orbit
+'''
+def geostationary_transfer(name = "geo"):
+    return {
+        "name": name,
+        "body": "EARTH",
+        "plots": [
+            {
+                "orbit": "EQUATORIAL_ORBIT",
+                "craft": {"name": "Satellite", "color": "lime"},
+                "maneuver": {"target_orbit": "GEOSTATIONARY_ORBIT", "color": "firebrick"}
+            }
+        ]
+    }
+
+def test_constants_resolve():
+    scenario = parse_scenario(geostationary_transfer(), "default")
+    orbit, craft, maneuver = scenario.plots[0]
+
+    assert scenario.name == "geo"
+    assert scenario.body is EARTH
+    assert orbit is EQUATORIAL_ORBIT
+    assert maneuver.target_orbit is GEOSTATIONARY_ORBIT
+    assert (craft.name, craft.color) == ("Satellite", "lime")
+
+def test_tables_resolve():
+    scenario = parse_scenario({"body": {"name": "Planet", "mass": 1e24, "radius": 5000, "color": "red"}, "plots": [{"orbit": {"apogee": 800, "perigee": 600, "inclination": 10}, "craft": {"name": "A", "color": "white"}}]}, "default")
+    orbit, craft, maneuver = scenario.plots[0]
+
+    assert scenario.name == "default"
+    assert (scenario.body.name, scenario.body.radius) == ("Planet", 5000)
+    assert (orbit.apogee, orbit.perigee, orbit.inclination) == (800, 600, 10)
+    assert maneuver is None
+
+@pytest.mark.parametrize("name", ["../x", "a/b", "a\\b", "..", ""])
+def test_names_that_are_paths_are_rejected(name):
+    with pytest.raises(ValueError):
+        parse_scenario(geostationary_transfer(name), "default")
+
+@pytest.mark.parametrize("description", [
+    {"body": "EARTH", "plots": [5]},
+    {"body": "EARTH", "plots": {"orbit": "POLAR_ORBIT"}},
+    {"body": "EARTH", "plots": [{"orbit": {"apogee": "x", "perigee": 400, "inclination": 0}, "craft": {"name": "A", "color": "white"}}]},
+    {"body": "EARTH", "plots": [{"orbit": "POLAR_ORBIT", "craft": {"name": "A", "color": "white"}, "maneuver": "target_orbit color"}]},
+    {"body": "EARTH", "plots": [{"orbit": "NOT_AN_ORBIT", "craft": {"name": "A", "color": "white"}}]},
+    {"body": {"name": "Planet"}},
+    {"plots": []},
+    [],
+])
+def test_malformed_scenarios_are_rejected(description):
+    with pytest.raises(ValueError):
+        parse_scenario(description, "default")
+
+def test_load_scenarios_reads_lists_of_scenarios(tmp_path):
+    (tmp_path / "many.json").write_text(json.dumps({"scenarios": [geostationary_transfer("a"), {"body": "MOON"}]}))
+    (tmp_path / "ignored.txt").write_text("not a scenario")
+
+    assert [scenario.name for scenario in load_scenarios(str(tmp_path))] == ["a", "many-1"]
+
+def test_geostationary_transfer_delta_v():
+    assert Maneuver(GEOSTATIONARY_ORBIT, "red").calculate_delta_v(EQUATORIAL_ORBIT, EARTH) == pytest.approx(3.854, abs = 1e-3)
+
+def test_unchanged_scenarios_are_cached(tmp_path):
+    scenarios = [parse_scenario(geostationary_transfer(), "default")]
+    output_dir = str(tmp_path)
+
+    first = list(run_scenarios(scenarios, output_dir, 1))
+    assert [status for scenario, status, elapsed, result in first] == ["rendered"]
+    assert os.path.exists(os.path.join(output_dir, "geo.png"))
+
+    second = list(run_scenarios(scenarios, output_dir, 1))
+    assert [status for scenario, status, elapsed, result in second] == ["cached"]
+    assert second[0][3] == pytest.approx(first[0][3])
+
+    forced = list(run_scenarios(scenarios, output_dir, 1, force = True))
+    assert [status for scenario, status, elapsed, result in forced] == ["rendered"]
+
+    with open(os.path.join(output_dir, CACHE_FILE_NAME), "r", encoding = "utf-8") as f:
+        assert set(json.load(f)) == {"geo"}
+
+def test_changed_scenarios_are_rendered_again(tmp_path):
+    output_dir = str(tmp_path)
+    list(run_scenarios([parse_scenario(geostationary_transfer(), "default")], output_dir, 1))
+
+    changed = geostationary_transfer()
+    changed["plots"][0]["craft"]["color"] = "white"
+
+    assert [status for scenario, status, elapsed, result in run_scenarios([parse_scenario(changed, "default")], output_dir, 1)] == ["rendered"]
+
+def test_duplicate_names_are_rejected(tmp_path):
+    scenarios = [parse_scenario(geostationary_transfer(), "default"), parse_scenario(geostationary_transfer(), "default")]
+
+    with pytest.raises(ValueError):
+        list(run_scenarios(scenarios, str(tmp_path), 1))